@@ -81,6 +81,47 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# File-based caches are shared by every worker process on one host only;
+# run on several hosts and these must move to Redis or Memcached.
+#
+# 'default' holds generated test cases, one payload per session (about
+# 10-20 KB each). Entries live as long as the session cookie. Once
+# MAX_ENTRIES is reached FileBasedCache deletes a random third of its
+# files, so the cap is set well above the number of live sessions to keep
+# active users' results from being dropped early. Sessions are not stored
+# here (see SESSION_FILE_PATH below), so culling can never log anyone out.
+
+SESSION_COOKIE_AGE = 60 * 60 * 24 * 7 * 2
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / '.django_cache' / 'testcases',
+        'TIMEOUT': SESSION_COOKIE_AGE,
+        'OPTIONS': {
+            'MAX_ENTRIES': 100000,
+        },
+    }
+}
+
+
+# Sessions
+# https://docs.djangoproject.com/en/5.2/topics/http/sessions/
+# Keep sessions out of SQLite so requests don't queue on its write lock.
+# The file engine writes one small file per session and never culls;
+# expired files are removed by `manage.py clearsessions`. Like the cache
+# above, this only works for workers sharing one host's filesystem. The
+# directory is created by GeneratorConfig.ready().
+
+SESSION_ENGINE = 'django.contrib.sessions.backends.file'
+SESSION_FILE_PATH = BASE_DIR / '.django_cache' / 'sessions'
+
+# How long generated test cases stay retrievable after a generation.
+TESTCASES_CACHE_TIMEOUT = SESSION_COOKIE_AGE
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
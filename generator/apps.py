@@ -1,6 +1,17 @@
+import os
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class GeneratorConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'generator'
+
+    def ready(self):
+        # The file session engine refuses to start if this directory is missing
+        if (
+            settings.SESSION_ENGINE == 'django.contrib.sessions.backends.file'
+            and settings.SESSION_FILE_PATH
+        ):
+            os.makedirs(settings.SESSION_FILE_PATH, exist_ok=True)
@@ -1,17 +1,27 @@
 import os
 import requests
-from dotenv import load_dotenv
 import json
+from functools import lru_cache
+
+
+# Load the .env file once, on first use instead of at import time
+@lru_cache(maxsize=None)
+def _load_env():
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
-# Load the .env file
-load_dotenv()
 
 # Get the GitHub token
-github_token = os.getenv("GITHUB_TOKEN")
+def get_github_token():
+    _load_env()
+    return os.getenv("GITHUB_TOKEN")
 
 
 # Main function to generate test cases
 def generate_test_cases(requirement):
+    github_token = get_github_token()
+
     # Check if GitHub token exists
     if not github_token:
         return [
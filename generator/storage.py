@@ -0,0 +1,27 @@
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def store_testcases(session, requirement, testcases):
+    """Cache the generated test cases and keep only their key in the session"""
+    key = f"testcases:{uuid.uuid4().hex}"
+    cache.set(
+        key,
+        {"requirement": requirement, "testcases": testcases},
+        settings.TESTCASES_CACHE_TIMEOUT,
+    )
+    old_key = session.get("testcases_key")
+    if old_key:
+        cache.delete(old_key)
+    session["testcases_key"] = key
+
+
+def load_testcases(session):
+    """Return (requirement, testcases) for the session, or ("", None) if none stored"""
+    key = session.get("testcases_key")
+    data = cache.get(key) if key else None
+    if data is None:
+        return "", None
+    return data["requirement"], data["testcases"]
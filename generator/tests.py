@@ -1,3 +1,121 @@
-from django.test import TestCase
+import json
+import shutil
+import tempfile
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .storage import store_testcases
+
+
+def _model_response(titles):
+    """Build a fake GitHub Models API response returning the given test cases"""
+    cases = [
+        {
+            "id": i,
+            "title": title,
+            "pytest_code": f"def test_{i}():\n    assert True",
+            "robot_code": f"*** Test Cases ***\nCase {i}\n    Log    ok",
+        }
+        for i, title in enumerate(titles, start=1)
+    ]
+    response = mock.Mock(status_code=200, headers={})
+    response.json.return_value = {
+        "choices": [{"message": {"content": json.dumps(cases)}}]
+    }
+    return response
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+@mock.patch.dict("os.environ", {"GITHUB_TOKEN": "test-token"})
+class SessionStorageTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        session_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, session_dir)
+        cls.enterClassContext(override_settings(SESSION_FILE_PATH=session_dir))
+
+    def setUp(self):
+        cache.clear()
+
+    def generate(self, requirement, titles):
+        with mock.patch(
+            "generator.openAI_api.requests.post",
+            return_value=_model_response(titles),
+        ), mock.patch("builtins.print"):
+            return self.client.post(
+                reverse("generate_testcases"), {"requirement": requirement}
+            )
+
+    def test_generate_stores_only_key_in_session(self):
+        response = self.generate("login", ["Valid login", "Invalid login"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(self.client.session.keys()), ["testcases_key"])
+        stored = cache.get(self.client.session["testcases_key"])
+        self.assertEqual(stored["requirement"], "login")
+        self.assertEqual(len(stored["testcases"]), 2)
+
+    def test_views_read_back_stored_testcases(self):
+        self.generate("login", ["Valid login", "Invalid login"])
+
+        response = self.client.get(reverse("result"))
+        self.assertContains(response, "Valid login")
+
+        response = self.client.get(reverse("test_cases_json"))
+        self.assertEqual(
+            [case["title"] for case in response.json()],
+            ["Valid login", "Invalid login"],
+        )
+
+        response = self.client.get(reverse("test_case_json", args=[2]))
+        self.assertEqual(response.json()["title"], "Invalid login")
+
+        response = self.client.get(reverse("test_case_json", args=[9]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_second_generation_deletes_previous_key(self):
+        self.generate("login", ["Valid login"])
+        first_key = self.client.session["testcases_key"]
+
+        self.generate("logout", ["Logout"])
+        second_key = self.client.session["testcases_key"]
+
+        self.assertNotEqual(first_key, second_key)
+        self.assertIsNone(cache.get(first_key))
+        self.assertEqual(cache.get(second_key)["requirement"], "logout")
+
+    def test_expired_cache_entry_is_treated_as_missing(self):
+        self.generate("login", ["Valid login"])
+        cache.delete(self.client.session["testcases_key"])
+
+        self.assertContains(
+            self.client.get(reverse("result")), "No test cases found"
+        )
+        self.assertEqual(self.client.get(reverse("test_cases_json")).status_code, 404)
+        self.assertEqual(
+            self.client.get(reverse("test_case_json", args=[1])).status_code, 404
+        )
+        self.assertEqual(
+            self.client.get(reverse("export_testcases_excel")).status_code, 400
+        )
+
+    def test_missing_session_key_is_treated_as_missing(self):
+        self.assertContains(
+            self.client.get(reverse("result")), "No test cases found"
+        )
+        self.assertEqual(self.client.get(reverse("test_cases_json")).status_code, 404)
+
+    def test_empty_stored_list_returns_empty_json(self):
+        session = self.client.session
+        store_testcases(session, "login", [])
+        session.save()
+
+        response = self.client.get(reverse("test_cases_json"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
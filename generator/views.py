@@ -1,11 +1,7 @@
 from django.shortcuts import render
 from django.http import JsonResponse
-from .openAI_api import generate_test_cases
-import openpyxl
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.hyperlink import Hyperlink
-from openpyxl.styles import Font
 from django.http import HttpResponse
+from .storage import load_testcases, store_testcases
 
 
 def home(request):
@@ -25,12 +21,14 @@ def generate_testcases(request):
                 {"error": "Please enter a requirement."},
             )
 
+        # Imported here so workers don't load requests/dotenv until needed
+        from .openAI_api import generate_test_cases
+
         # Generate test cases using the API
         testcases = generate_test_cases(requirement)
 
-        # Store in session for JSON endpoints
-        request.session["testcases"] = testcases
-        request.session["requirement"] = requirement
+        # Store in cache for JSON endpoints, session only holds the key
+        store_testcases(request.session, requirement, testcases)
 
         return render(
             request,
@@ -44,8 +42,7 @@ def generate_testcases(request):
 
 def result(request):
     """Display stored test cases from session"""
-    testcases = request.session.get("testcases", [])
-    requirement = request.session.get("requirement", "")
+    requirement, testcases = load_testcases(request.session)
 
     if not testcases:
         return render(
@@ -63,16 +60,17 @@ def result(request):
 
 def test_cases_json(request):
     """Return all test cases as JSON"""
-    if "testcases" in request.session:
-        return JsonResponse(request.session["testcases"], safe=False)
+    _, testcases = load_testcases(request.session)
+    if testcases is not None:
+        return JsonResponse(testcases, safe=False)
     else:
         return JsonResponse({"error": "No test cases found in session"}, status=404)
 
 
 def test_case_json(request, case_id):
     """Return a specific test case as JSON"""
-    if "testcases" in request.session:
-        testcases = request.session["testcases"]
+    _, testcases = load_testcases(request.session)
+    if testcases is not None:
         for case in testcases:
             if case.get("id") == int(case_id):
                 return JsonResponse(case)
@@ -84,10 +82,15 @@ def test_case_json(request, case_id):
 
 
 def export_testcases_excel(request):
-    testcases = request.session.get("testcases", [])
+    _, testcases = load_testcases(request.session)
     if not testcases:
         return HttpResponse("No test cases to export.", status=400)
 
+    # openpyxl is only needed for exports, so load it on demand
+    import openpyxl
+    from openpyxl.utils import get_column_letter
+    from openpyxl.styles import Font
+
     wb = openpyxl.Workbook()
     ws_main = wb.active
     ws_main.title = "Test Cases"
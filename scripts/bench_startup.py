@@ -0,0 +1,295 @@
+"""
+Benchmark worker boot time and session write contention.
+
+1. Import time: times a cold ``import generator.views`` in fresh
+   subprocesses, once as the views module is now (lazy imports) and once
+   with the baseline's eager openpyxl/requests/dotenv imports and
+   ``load_dotenv()`` call added on top.
+
+2. Session writes: N worker processes each save a realistic generation
+   (5 test cases with pytest and Robot Framework code) M times, first
+   through the database session engine on SQLite the way the baseline
+   stored it, then through the file session engine plus a key-only
+   session backed by the file cache. SQLite's busy timeout is set to 0 so
+   every "database is locked" error surfaces; the writer retries after
+   1 ms and the retries and time spent waiting, summed over all writers,
+   are reported. "total" is the wall time of the slowest writer once all
+   of them have started.
+
+Run from the repository root:
+
+    python scripts/bench_startup.py --workers 8 --writes 50
+"""
+
+import argparse
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_DIR))
+
+LAZY_IMPORT = """
+import os, sys, time
+os.environ["DJANGO_SETTINGS_MODULE"] = "ai_testgen.settings"
+start = time.perf_counter()
+import django
+django.setup()
+import generator.views
+print(time.perf_counter() - start)
+"""
+
+# What the baseline paid at import time on top of the current module
+EAGER_IMPORT = """
+import os, sys, time
+os.environ["DJANGO_SETTINGS_MODULE"] = "ai_testgen.settings"
+start = time.perf_counter()
+import django
+django.setup()
+import generator.views
+import openpyxl
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.styles import Font
+import requests
+from dotenv import load_dotenv
+load_dotenv()
+print(time.perf_counter() - start)
+"""
+
+PYTEST_CODE = '''import pytest
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+
+
+@pytest.fixture
+def driver():
+    driver = webdriver.Chrome()
+    driver.get("https://example.com/login")
+    yield driver
+    driver.quit()
+
+
+def test_case_{n}(driver):
+    driver.find_element(By.ID, "username").send_keys("user{n}@example.com")
+    driver.find_element(By.ID, "password").send_keys("CorrectHorse{n}!")
+    driver.find_element(By.ID, "login").click()
+    assert "Dashboard" in driver.title
+    assert driver.find_element(By.CSS_SELECTOR, ".welcome").is_displayed()
+'''
+
+ROBOT_CODE = '''*** Settings ***
+Library    SeleniumLibrary
+
+*** Variables ***
+${{URL}}    https://example.com/login
+
+*** Test Cases ***
+Test Case {n}
+    Open Browser    ${{URL}}    chrome
+    Input Text    id=username    user{n}@example.com
+    Input Text    id=password    CorrectHorse{n}!
+    Click Button    id=login
+    Title Should Be    Dashboard
+    Element Should Be Visible    css=.welcome
+    [Teardown]    Close Browser
+'''
+
+
+def make_testcases():
+    return [
+        {
+            "id": n,
+            "title": f"Login scenario {n}",
+            "description": f"Verify that login scenario {n} behaves as specified.",
+            "input": f"user{n}@example.com / CorrectHorse{n}!",
+            "expected_output": "User is redirected to the dashboard",
+            "priority": "High",
+            "type": "Functional",
+            "pytest_code": PYTEST_CODE.format(n=n),
+            "robot_code": ROBOT_CODE.format(n=n),
+            "manual_steps": "1. Open the app\n2. Enter credentials\n"
+            "3. Click Login\n4. Verify dashboard is shown",
+        }
+        for n in range(1, 6)
+    ]
+
+
+def time_imports(code, runs):
+    timings = []
+    for _ in range(runs):
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=REPO_DIR,
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        timings.append(float(out.stdout.strip().splitlines()[-1]))
+    return statistics.median(timings)
+
+
+def configure_django(workdir, engine):
+    import django
+    from django.conf import settings
+
+    settings.configure(
+        SECRET_KEY="bench",
+        INSTALLED_APPS=["django.contrib.sessions"],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": os.path.join(workdir, "db.sqlite3"),
+                "OPTIONS": {"timeout": 0},
+            }
+        },
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": os.path.join(workdir, "cache"),
+                "OPTIONS": {"MAX_ENTRIES": 100000},
+            }
+        },
+        SESSION_ENGINE=engine,
+        SESSION_FILE_PATH=os.path.join(workdir, "sessions"),
+        SESSION_COOKIE_AGE=60 * 60 * 24 * 7 * 2,
+        TESTCASES_CACHE_TIMEOUT=60 * 60 * 24 * 7 * 2,
+        USE_TZ=True,
+    )
+    django.setup()
+
+
+def save_with_retry(save, stats):
+    from django.contrib.sessions.backends.base import UpdateError
+    from django.db import OperationalError
+
+    while True:
+        start = time.perf_counter()
+        try:
+            save()
+            return
+        except (OperationalError, UpdateError) as exc:
+            # The db engine re-raises lock errors on update as UpdateError
+            if "database is locked" not in f"{exc} {exc.__context__}":
+                raise
+            stats["retries"] += 1
+            time.sleep(0.001)
+            stats["wait"] += time.perf_counter() - start
+
+
+def writer(workdir, engine, writes, key_only, barrier, results):
+    try:
+        results.put(_write_sessions(workdir, engine, writes, key_only, barrier))
+    except BaseException as exc:
+        barrier.abort()
+        results.put(exc)
+        raise
+
+
+def _write_sessions(workdir, engine, writes, key_only, barrier):
+    configure_django(workdir, engine)
+
+    from importlib import import_module
+
+    from django.conf import settings
+
+    from generator.storage import store_testcases
+
+    SessionStore = import_module(settings.SESSION_ENGINE).SessionStore
+    stats = {"retries": 0, "wait": 0.0}
+    testcases = make_testcases()
+
+    session = SessionStore()
+    save_with_retry(session.create, stats)
+    barrier.wait()
+    start = time.perf_counter()
+    for i in range(writes):
+        requirement = f"login flow {i}"
+        if key_only:
+            store_testcases(session, requirement, testcases)
+        else:
+            session["testcases"] = testcases
+            session["requirement"] = requirement
+        save_with_retry(session.save, stats)
+    stats["elapsed"] = time.perf_counter() - start
+    return stats
+
+
+def run_sessions(engine, workers, writes, key_only):
+    with tempfile.TemporaryDirectory() as workdir:
+        os.makedirs(os.path.join(workdir, "sessions"))
+        ctx = multiprocessing.get_context("spawn")
+        # Create the sessions table before the writers start
+        migrate = ctx.Process(target=_migrate, args=(workdir, engine))
+        migrate.start()
+        migrate.join()
+
+        # Writers boot Django first, then start writing together
+        barrier = ctx.Barrier(workers)
+        queue = ctx.Queue()
+        procs = [
+            ctx.Process(
+                target=writer,
+                args=(workdir, engine, writes, key_only, barrier, queue),
+            )
+            for _ in range(workers)
+        ]
+        for proc in procs:
+            proc.start()
+        results = [queue.get() for _ in procs]
+        for proc in procs:
+            proc.join()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    return {
+        "total": max(r["elapsed"] for r in results),
+        "retries": sum(r["retries"] for r in results),
+        "wait": sum(r["wait"] for r in results),
+    }
+
+
+def _migrate(workdir, engine):
+    configure_django(workdir, engine)
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--writes", type=int, default=50)
+    parser.add_argument("--import-runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"Cold import of generator.views (median of {args.import_runs} runs)")
+    eager = time_imports(EAGER_IMPORT, args.import_runs)
+    lazy = time_imports(LAZY_IMPORT, args.import_runs)
+    print(f"  eager (baseline): {eager * 1000:8.1f} ms")
+    print(f"  lazy:             {lazy * 1000:8.1f} ms")
+
+    print(
+        f"\nSession writes: {args.workers} workers x {args.writes} generations"
+    )
+    runs = [
+        ("db session, full payload (baseline)", "django.contrib.sessions.backends.db", False),
+        ("file session, key only", "django.contrib.sessions.backends.file", True),
+    ]
+    for label, engine, key_only in runs:
+        result = run_sessions(engine, args.workers, args.writes, key_only)
+        print(
+            f"  {label:38} total {result['total']:6.2f} s   "
+            f"locked retries {result['retries']:6d}   "
+            f"lock wait {result['wait']:6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()